@@ -25,6 +25,17 @@ impl Pipeline {
     /// Load pipeline from TOML configuration file
     pub fn from_toml<P: AsRef<Path>>(path: P) -> Result<Self> {
         let config = PipelineConfig::from_toml_file(path.as_ref())?;
+        Self::from_config(config)
+    }
+
+    /// Load pipeline from a TOML configuration string
+    pub fn from_toml_str(s: &str) -> Result<Self> {
+        let config = PipelineConfig::from_toml_str(s)?;
+        Self::from_config(config)
+    }
+
+    /// Build pipeline from a parsed configuration
+    pub fn from_config(config: PipelineConfig) -> Result<Self> {
         let mut pipeline = Self::new();
         pipeline.config = Some(config.clone());
 
@@ -146,4 +157,28 @@ mod tests {
         assert_eq!(pipeline.len(), 0);
         assert!(pipeline.is_empty());
     }
+
+    #[test]
+    fn test_from_toml_str() {
+        let pipeline = Pipeline::from_toml_str(
+            r#"
+[pipeline]
+name = "test"
+
+[[operations]]
+type = "fill_null"
+method = "forward"
+
+[[operations]]
+type = "standardize"
+"#,
+        )
+        .unwrap();
+        assert_eq!(pipeline.len(), 2);
+    }
+
+    #[test]
+    fn test_from_toml_str_invalid() {
+        assert!(Pipeline::from_toml_str("invalid toml content [[[").is_err());
+    }
 }
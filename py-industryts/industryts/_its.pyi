@@ -6,6 +6,9 @@ It should be kept in sync with the actual Rust implementation in py-industryts/s
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 import polars as pl
 
 class TimeSeriesData:
@@ -50,6 +53,15 @@ class TimeSeriesData:
         """
         ...
 
+    @property
+    def columns(self) -> list[str]:
+        """Get all column names.
+
+        Returns:
+            List of column names in DataFrame order
+        """
+        ...
+
     def __len__(self) -> int:
         """Get the number of rows.
 
@@ -89,6 +101,30 @@ class Pipeline:
         """
         ...
 
+    @staticmethod
+    def from_toml_str(s: str) -> Pipeline:
+        """Load pipeline from TOML configuration string.
+
+        Args:
+            s: TOML configuration text
+
+        Returns:
+            Configured Pipeline instance
+        """
+        ...
+
+    @staticmethod
+    def from_dict(config: Mapping[str, Any]) -> Pipeline:
+        """Build pipeline from a configuration dict.
+
+        Args:
+            config: Dict with the same layout as the TOML config
+
+        Returns:
+            Configured Pipeline instance
+        """
+        ...
+
     def process(self, data: TimeSeriesData) -> TimeSeriesData:
         """Execute pipeline on time series data.
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 from industryts import _its
 from industryts.timeseries import TimeSeriesData
@@ -91,6 +93,70 @@ class Pipeline:
         instance._inner = inner
         return instance
 
+    @classmethod
+    def from_toml_str(cls, config: str) -> Pipeline:
+        """Load pipeline from a TOML configuration string.
+
+        Accepts the same structure as `from_toml`, without touching the filesystem.
+
+        Args:
+            config: TOML configuration text
+
+        Returns:
+            Pipeline instance loaded from config
+
+        Raises:
+            ValueError: If configuration is invalid
+
+        Example:
+            >>> pipeline = Pipeline.from_toml_str('''
+            ... [pipeline]
+            ... name = "cleaning"
+            ...
+            ... [[operations]]
+            ... type = "fill_null"
+            ... method = "forward"
+            ... ''')
+            >>> print(len(pipeline))
+            1
+        """
+        inner = _its.Pipeline.from_toml_str(config)
+        instance = cls.__new__(cls)
+        instance._inner = inner
+        return instance
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> Pipeline:
+        """Build pipeline from a configuration dict.
+
+        The dict mirrors the TOML layout accepted by `from_toml`: a ``pipeline``
+        table and a list of ``operations``. No TOML text is produced or parsed.
+
+        Args:
+            config: Pipeline configuration
+
+        Returns:
+            Pipeline instance built from config
+
+        Raises:
+            ValueError: If configuration is invalid
+
+        Example:
+            >>> pipeline = Pipeline.from_dict({
+            ...     "pipeline": {"name": "cleaning"},
+            ...     "operations": [
+            ...         {"type": "fill_null", "method": "forward"},
+            ...         {"type": "fill_null", "method": "backward"},
+            ...     ],
+            ... })
+            >>> print(len(pipeline))
+            2
+        """
+        inner = _its.Pipeline.from_dict(config)
+        instance = cls.__new__(cls)
+        instance._inner = inner
+        return instance
+
     def process(self, data: TimeSeriesData) -> TimeSeriesData:
         """Process time series data through the pipeline.
 
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Literal
 
 import polars as pl
 
 from industryts import _its
 
+ParquetCompression = Literal[
+    "lz4", "uncompressed", "snappy", "gzip", "lzo", "brotli", "zstd"
+]
+
 
 class TimeSeriesData:
     """High-performance time series data container.
@@ -19,6 +23,7 @@ class TimeSeriesData:
     Attributes:
         time_column: Name of the time index column
         feature_columns: List of feature column names
+        columns: List of all column names
 
     Example:
         >>> import industryts as its
@@ -51,12 +56,15 @@ class TimeSeriesData:
                 If no match found, uses first column.
 
         Raises:
+            TypeError: If data is not a Polars DataFrame
             ValueError: If data is empty or time column cannot be determined
 
         Example:
             >>> df = pl.DataFrame({"time": [...], "value": [...]})
             >>> ts = TimeSeriesData(df, time_column="time")
         """
+        if not isinstance(data, pl.DataFrame):
+            raise TypeError(f"Expected a polars DataFrame, got {type(data).__name__}")
         self._inner = _its.TimeSeriesData(data, time_column)
 
     @property
@@ -77,6 +85,17 @@ class TimeSeriesData:
         """
         return self._inner.feature_columns
 
+    @property
+    def columns(self) -> list[str]:
+        """Get the names of all columns, including the time column.
+
+        Reads the names on the Rust side without copying the data to Python.
+
+        Returns:
+            List of column names in DataFrame order
+        """
+        return self._inner.columns
+
     def to_polars(self) -> pl.DataFrame:
         """Convert to Polars DataFrame.
 
@@ -125,14 +144,14 @@ class TimeSeriesData:
     @classmethod
     def from_parquet(
         cls,
-        path: str | Path,
+        path: str | Path | IO[bytes],
         time_column: str | None = None,
         **kwargs: Any,
     ) -> TimeSeriesData:
         """Load time series data from Parquet file.
 
         Args:
-            path: Path to Parquet file
+            path: Path to Parquet file, or a binary file-like object
             time_column: Name of the time column (auto-detected if None)
             **kwargs: Additional arguments passed to polars.read_parquet()
 
@@ -145,6 +164,29 @@ class TimeSeriesData:
         df = pl.read_parquet(path, **kwargs)
         return cls(df, time_column)
 
+    @classmethod
+    def from_ipc(
+        cls,
+        path: str | Path,
+        time_column: str | None = None,
+        **kwargs: Any,
+    ) -> TimeSeriesData:
+        """Load time series data from Arrow IPC (Feather v2) file.
+
+        Args:
+            path: Path to IPC file
+            time_column: Name of the time column (auto-detected if None)
+            **kwargs: Additional arguments passed to polars.read_ipc()
+
+        Returns:
+            TimeSeriesData instance
+
+        Example:
+            >>> ts_data = TimeSeriesData.from_ipc("data.arrow")
+        """
+        df = pl.read_ipc(path, **kwargs)
+        return cls(df, time_column)
+
     def to_csv(self, path: str | Path, **kwargs: Any) -> None:
         """Save time series data to CSV file.
 
@@ -158,18 +200,63 @@ class TimeSeriesData:
         df = self.to_polars()
         df.write_csv(path, **kwargs)
 
-    def to_parquet(self, path: str | Path, **kwargs: Any) -> None:
+    def to_parquet(
+        self,
+        path: str | Path | IO[bytes],
+        engine: Literal["polars", "pyarrow"] | None = None,
+        compression: ParquetCompression = "zstd",
+        **kwargs: Any,
+    ) -> None:
         """Save time series data to Parquet file.
 
         Args:
-            path: Output file path
-            **kwargs: Additional arguments passed to DataFrame.write_parquet()
+            path: Output file path, or a binary file-like object
+            engine: Writer to use, "polars" by default. "pyarrow" can be faster
+                for string-heavy data.
+            compression: Compression codec, e.g. "zstd", "snappy", "lz4" or
+                "uncompressed"
+            **kwargs: Additional arguments passed to DataFrame.write_parquet().
+                A ``use_pyarrow`` flag is still accepted and selects the engine.
+
+        Raises:
+            ValueError: If engine is not "polars" or "pyarrow", or disagrees
+                with ``use_pyarrow``
 
         Example:
             >>> ts_data.to_parquet("output.parquet")
+            >>> ts_data.to_parquet("output.parquet", engine="pyarrow", compression="snappy")
+        """
+        if "use_pyarrow" in kwargs:
+            use_pyarrow = kwargs.pop("use_pyarrow")
+            if engine is not None and (engine == "pyarrow") != bool(use_pyarrow):
+                raise ValueError(
+                    f"engine={engine!r} conflicts with use_pyarrow={use_pyarrow!r}"
+                )
+            engine = "pyarrow" if use_pyarrow else "polars"
+        elif engine is None:
+            engine = "polars"
+        if engine not in ("polars", "pyarrow"):
+            raise ValueError(f"engine must be 'polars' or 'pyarrow', got {engine!r}")
+        df = self.to_polars()
+        df.write_parquet(
+            path,
+            compression=compression,
+            use_pyarrow=engine == "pyarrow",
+            **kwargs,
+        )
+
+    def to_ipc(self, path: str | Path, **kwargs: Any) -> None:
+        """Save time series data to Arrow IPC (Feather v2) file.
+
+        Args:
+            path: Output file path
+            **kwargs: Additional arguments passed to DataFrame.write_ipc()
+
+        Example:
+            >>> ts_data.to_ipc("output.arrow")
         """
         df = self.to_polars()
-        df.write_parquet(path, **kwargs)
+        df.write_ipc(path, **kwargs)
 
     def __len__(self) -> int:
         """Get the number of rows in the time series.
@@ -2,9 +2,12 @@
 //!
 //! This module provides Python bindings for the Rust-based industryts library.
 
-use industryts_core::{Pipeline as CorePipeline, TimeSeriesData as CoreTimeSeriesData};
+use industryts_core::{
+    Pipeline as CorePipeline, PipelineConfig, TimeSeriesData as CoreTimeSeriesData,
+};
 use pyo3::prelude::*;
 use pyo3_polars::PyDataFrame;
+use pythonize::depythonize;
 
 /// Python wrapper for TimeSeriesData
 #[pyclass(name = "TimeSeriesData")]
@@ -43,6 +46,17 @@ impl PyTimeSeriesData {
         self.inner.feature_columns().to_vec()
     }
 
+    /// Get all column names in DataFrame order
+    #[getter]
+    pub fn columns(&self) -> Vec<String> {
+        self.inner
+            .dataframe()
+            .get_column_names()
+            .iter()
+            .map(|name| name.to_string())
+            .collect()
+    }
+
     /// Get number of rows
     pub fn __len__(&self) -> usize {
         self.inner.len()
@@ -90,11 +104,35 @@ impl PyPipeline {
         Ok(Self { inner: pipeline })
     }
 
+    /// Load pipeline from TOML string
+    #[staticmethod]
+    pub fn from_toml_str(s: &str) -> PyResult<Self> {
+        let pipeline = CorePipeline::from_toml_str(s)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+        Ok(Self { inner: pipeline })
+    }
+
+    /// Build pipeline from a dict with the same layout as the TOML config
+    #[staticmethod]
+    pub fn from_dict(config: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let config: PipelineConfig = depythonize(config)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        let pipeline = CorePipeline::from_config(config)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+        Ok(Self { inner: pipeline })
+    }
+
     /// Process time series data through the pipeline
-    pub fn process(&self, data: &PyTimeSeriesData) -> PyResult<PyTimeSeriesData> {
-        let result = self
-            .inner
-            .process(data.inner.clone())
+    ///
+    /// The GIL is released while the operations run, so pipelines can be
+    /// driven concurrently from Python threads.
+    pub fn process(&self, py: Python<'_>, data: &PyTimeSeriesData) -> PyResult<PyTimeSeriesData> {
+        let input = data.inner.clone();
+        let pipeline = &self.inner;
+        let result = py
+            .allow_threads(move || pipeline.process(input))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
         Ok(PyTimeSeriesData { inner: result })
@@ -2,15 +2,88 @@
 
 from __future__ import annotations
 
-import tempfile
+import io
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+import industryts as its
 import polars as pl
+import pyarrow as pa
 import pytest
 
+PipelineFactory = Callable[[dict[str, Any]], its.Pipeline]
 
-@pytest.fixture
+BASIC_PIPELINE_TOML = """
+[pipeline]
+name = "test_pipeline"
+
+[[operations]]
+type = "fill_null"
+method = "forward"
+
+[[operations]]
+type = "standardize"
+"""
+
+BASIC_PIPELINE_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "test_pipeline"},
+    "operations": [
+        {"type": "fill_null", "method": "forward"},
+        {"type": "standardize"},
+    ],
+}
+
+FEATURE_ENGINEERING_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "feature_engineering"},
+    "operations": [
+        {"type": "fill_null", "method": "forward"},
+        {"type": "lag", "periods": [1, 2, 3], "columns": ["temperature", "pressure"]},
+        {"type": "standardize"},
+    ],
+}
+
+CLEANING_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "cleaning"},
+    "operations": [
+        {"type": "fill_null", "method": "forward"},
+        {"type": "fill_null", "method": "backward"},
+    ],
+}
+
+MULTI_OP_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "multi_op"},
+    "operations": [
+        {"type": "fill_null", "method": "forward"},
+        {"type": "lag", "periods": [1, 2], "columns": ["temperature"]},
+        {"type": "standardize"},
+    ],
+}
+
+FILL_NULL_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "fill_null"},
+    "operations": [
+        {"type": "fill_null", "method": "forward"},
+    ],
+}
+
+STANDARDIZE_CONFIG: dict[str, Any] = {
+    "pipeline": {"name": "standardize"},
+    "operations": [
+        {"type": "standardize", "columns": ["temperature", "pressure"]},
+    ],
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def polars_streaming_config() -> Iterator[None]:
+    """Use one large streaming chunk for the whole session; the test frames are tiny."""
+    with pl.Config(streaming_chunk_size=100_000):
+        yield
+
+
+@pytest.fixture(scope="session")
 def sample_datetime_range() -> pl.Series:
     """Create a sample datetime range for testing."""
     return pl.datetime_range(
@@ -21,66 +94,161 @@ def sample_datetime_range() -> pl.Series:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe(sample_datetime_range: pl.Series) -> pl.DataFrame:
     """Create a sample DataFrame with time series data."""
-    return pl.DataFrame({
-        "DateTime": sample_datetime_range,
-        "temperature": [20.1, 21.5, 19.8, 22.3, 21.0, 20.5, 21.2, 20.8, 21.5, 22.0],
-        "pressure": [1013, 1015, 1012, 1018, 1016, 1014, 1017, 1015, 1016, 1019],
+    table = pa.table({
+        "DateTime": sample_datetime_range.to_arrow(),
+        "temperature": pa.array(
+            [20.1, 21.5, 19.8, 22.3, 21.0, 20.5, 21.2, 20.8, 21.5, 22.0], pa.float64()
+        ),
+        "pressure": pa.array(
+            [1013, 1015, 1012, 1018, 1016, 1014, 1017, 1015, 1016, 1019], pa.int64()
+        ),
     })
+    return pl.from_arrow(table)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe_with_nulls(sample_datetime_range: pl.Series) -> pl.DataFrame:
     """Create a sample DataFrame with null values."""
-    return pl.DataFrame({
-        "DateTime": sample_datetime_range,
-        "temperature": [20.1, None, 19.8, 22.3, None, 20.5, 21.2, 20.8, None, 22.0],
-        "pressure": [1013, 1015, None, 1018, 1016, None, 1017, 1015, 1016, 1019],
+    table = pa.table({
+        "DateTime": sample_datetime_range.to_arrow(),
+        "temperature": pa.array(
+            [20.1, None, 19.8, 22.3, None, 20.5, 21.2, 20.8, None, 22.0], pa.float64()
+        ),
+        "pressure": pa.array(
+            [1013, 1015, None, 1018, 1016, None, 1017, 1015, 1016, 1019], pa.int64()
+        ),
     })
+    return pl.from_arrow(table)
 
 
-@pytest.fixture
-def temp_dir() -> Path:
-    """Create a temporary directory for file I/O tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="session")
+def sample_len(sample_dataframe: pl.DataFrame) -> int:
+    """Row count shared by ``sample_dataframe`` and ``sample_dataframe_with_nulls``."""
+    return sample_dataframe.height
 
 
-@pytest.fixture
-def basic_pipeline_config() -> str:
-    """TOML configuration for a basic pipeline."""
-    return """
-[pipeline]
-name = "test_pipeline"
+@pytest.fixture(scope="session")
+def ts_data(sample_dataframe: pl.DataFrame) -> its.TimeSeriesData:
+    """Shared TimeSeriesData wrapping ``sample_dataframe``."""
+    return its.TimeSeriesData(sample_dataframe)
 
-[[operations]]
-type = "fill_null"
-method = "forward"
 
-[[operations]]
-type = "standardize"
-"""
+@pytest.fixture(scope="session")
+def ts_data_nulls(sample_dataframe_with_nulls: pl.DataFrame) -> its.TimeSeriesData:
+    """Shared TimeSeriesData wrapping ``sample_dataframe_with_nulls``."""
+    return its.TimeSeriesData(sample_dataframe_with_nulls)
+
+
+@pytest.fixture(scope="session")
+def sample_ipc_bytes(sample_dataframe: pl.DataFrame) -> bytes:
+    """Serialize ``sample_dataframe`` once as uncompressed Arrow IPC."""
+    buf = io.BytesIO()
+    sample_dataframe.write_ipc(buf, compression="uncompressed")
+    return buf.getvalue()
 
 
 @pytest.fixture
-def feature_engineering_config() -> str:
-    """TOML configuration for feature engineering pipeline."""
-    return """
-[pipeline]
-name = "feature_engineering"
+def sample_dataframe_fresh(sample_ipc_bytes: bytes) -> pl.DataFrame:
+    """Create an unshared copy of ``sample_dataframe`` for tests that need one."""
+    return pl.read_ipc(io.BytesIO(sample_ipc_bytes), memory_map=False)
 
-[[operations]]
-type = "fill_null"
-method = "forward"
 
-[[operations]]
-type = "lag"
-periods = [1, 2, 3]
-columns = ["temperature", "pressure"]
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory for file I/O tests, shared by the session."""
+    return tmp_path_factory.mktemp("its")
 
-[[operations]]
-type = "standardize"
-"""
 
+@pytest.fixture(scope="session")
+def saved_ts_paths(tmp_path_factory: pytest.TempPathFactory, ts_data: its.TimeSeriesData) -> Path:
+    """Write ``ts_data`` once as ``x.csv``, ``x.parquet`` and ``x.arrow``; return the directory.
+
+    Loader tests read these files instead of each writing their own copy first.
+    """
+    directory = tmp_path_factory.mktemp("io")
+    ts_data.to_csv(str(directory / "x.csv"))
+    ts_data.to_parquet(str(directory / "x.parquet"))
+    ts_data.to_ipc(str(directory / "x.arrow"))
+    return directory
+
+
+@pytest.fixture(scope="session")
+def basic_pipeline_toml() -> str:
+    """TOML text for the basic pipeline, for tests of the TOML loaders."""
+    return BASIC_PIPELINE_TOML
+
+
+@pytest.fixture(scope="session")
+def basic_pipeline_config() -> dict[str, Any]:
+    """Configuration for a basic pipeline."""
+    return BASIC_PIPELINE_CONFIG
+
+
+@pytest.fixture(scope="session")
+def feature_engineering_config() -> dict[str, Any]:
+    """Configuration for feature engineering pipeline."""
+    return FEATURE_ENGINEERING_CONFIG
+
+
+@pytest.fixture(scope="session")
+def cleaning_pipeline_config() -> dict[str, Any]:
+    """Configuration that forward- then backward-fills nulls."""
+    return CLEANING_CONFIG
+
+
+@pytest.fixture(scope="session")
+def multi_op_pipeline_config() -> dict[str, Any]:
+    """Configuration chaining fill_null, lag and standardize."""
+    return MULTI_OP_CONFIG
+
+
+@pytest.fixture(scope="session")
+def fill_null_pipeline_config() -> dict[str, Any]:
+    """Configuration with a single forward fill (safe for tiny inputs)."""
+    return FILL_NULL_CONFIG
+
+
+@pytest.fixture(scope="session")
+def standardize_pipeline_config() -> dict[str, Any]:
+    """Configuration with a single standardize operation."""
+    return STANDARDIZE_CONFIG
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        BASIC_PIPELINE_CONFIG,
+        FEATURE_ENGINEERING_CONFIG,
+        CLEANING_CONFIG,
+        MULTI_OP_CONFIG,
+        FILL_NULL_CONFIG,
+        STANDARDIZE_CONFIG,
+    ],
+    ids=["basic", "feature_engineering", "cleaning", "multi_op", "fill_null", "standardize"],
+)
+def any_pipeline_config(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Each distinct configuration, for tests that don't depend on the shape."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def pipeline_factory() -> PipelineFactory:
+    """Build pipelines from config dicts, constructing each distinct config only once.
+
+    Pipelines are stateless between ``process`` calls, so the cached instance is
+    shared by every test that asks for the same configuration.
+    """
+    cache: dict[str, its.Pipeline] = {}
+
+    def make(config: dict[str, Any]) -> its.Pipeline:
+        key = repr(config)
+        pipeline = cache.get(key)
+        if pipeline is None:
+            pipeline = its.Pipeline.from_dict(config)
+            cache[key] = pipeline
+        return pipeline
+
+    return make
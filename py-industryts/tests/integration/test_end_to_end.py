@@ -2,138 +2,84 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import industryts as its
 import polars as pl
 import pytest
 
+if TYPE_CHECKING:
+    from tests.conftest import PipelineFactory
+
 
 class TestEndToEndWorkflows:
     """Test complete workflows from data loading to export."""
 
-    def test_csv_to_pipeline_to_csv(
+    @pytest.mark.parametrize("fmt", ["csv", "parquet", "ipc"])
+    def test_file_to_pipeline_to_file(
         self,
+        fmt: str,
         sample_dataframe: pl.DataFrame,
-        feature_engineering_config: str,
-        temp_dir: Path
+        feature_engineering_config: dict[str, Any],
+        temp_dir: Path,
+        pipeline_factory: PipelineFactory
     ) -> None:
-        """Test complete workflow: CSV -> Pipeline -> CSV."""
-        # Save input data
-        input_csv = temp_dir / "input.csv"
-        sample_dataframe.write_csv(str(input_csv))
-
-        # Save pipeline config
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(feature_engineering_config)
-
-        # Load data
-        ts_data = its.TimeSeriesData.from_csv(str(input_csv))
-
-        # Load and apply pipeline
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        """Test complete workflow: file -> Pipeline -> file, for each format."""
+        # Save input data through the streaming sink
+        input_path = temp_dir / f"workflow_input.{fmt}"
+        getattr(sample_dataframe.lazy(), f"sink_{fmt}")(str(input_path))
+
+        # Load data (CSV goes through the streaming reader)
+        if fmt == "csv":
+            df = pl.scan_csv(str(input_path), try_parse_dates=True).collect(engine="streaming")
+            ts_data = its.TimeSeriesData(df)
+        else:
+            ts_data = getattr(its.TimeSeriesData, f"from_{fmt}")(str(input_path))
+
+        # Apply pipeline
+        pipeline = pipeline_factory(feature_engineering_config)
         result = pipeline.process(ts_data)
 
         # Export results
-        output_csv = temp_dir / "output.csv"
-        result.to_csv(str(output_csv))
+        output_path = temp_dir / f"workflow_output.{fmt}"
+        getattr(result, f"to_{fmt}")(str(output_path))
 
-        # Verify output
-        assert output_csv.exists()
-        output_df = pl.read_csv(str(output_csv))
-        assert len(output_df) > 0
-
-    def test_parquet_to_pipeline_to_parquet(
-        self,
-        sample_dataframe: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
-    ) -> None:
-        """Test complete workflow: Parquet -> Pipeline -> Parquet."""
-        # Save input data
-        input_parquet = temp_dir / "input.parquet"
-        sample_dataframe.write_parquet(str(input_parquet))
-
-        # Save pipeline config
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-
-        # Load data
-        ts_data = its.TimeSeriesData.from_parquet(str(input_parquet))
-
-        # Load and apply pipeline
-        pipeline = its.Pipeline.from_toml(str(config_path))
-        result = pipeline.process(ts_data)
-
-        # Export results
-        output_parquet = temp_dir / "output.parquet"
-        result.to_parquet(str(output_parquet))
-
-        # Verify output
-        assert output_parquet.exists()
-        output_df = pl.read_parquet(str(output_parquet))
-        assert len(output_df) > 0
+        # Verify output (row count only; Parquet/IPC answer this from metadata)
+        assert output_path.exists()
+        scan = getattr(pl, f"scan_{fmt}")
+        assert scan(str(output_path)).select(pl.len()).collect().item() > 0
 
     def test_data_cleaning_workflow(
         self,
-        sample_dataframe_with_nulls: pl.DataFrame,
-        temp_dir: Path
+        ts_data_nulls: its.TimeSeriesData,
+        cleaning_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory,
+        sample_len: int
     ) -> None:
         """Test data cleaning workflow with null values."""
-        config = """
-[pipeline]
-name = "cleaning"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-
-[[operations]]
-type = "fill_null"
-method = "backward"
-"""
-        config_path = temp_dir / "cleaning.toml"
-        config_path.write_text(config)
-
         # Process
-        ts_data = its.TimeSeriesData(sample_dataframe_with_nulls)
-        pipeline = its.Pipeline.from_toml(str(config_path))
-        result = pipeline.process(ts_data)
+        pipeline = pipeline_factory(cleaning_pipeline_config)
+        result = pipeline.process(ts_data_nulls)
 
         # Verify
         assert result is not None
-        assert len(result) == len(ts_data)
+        assert len(result) == sample_len
 
     def test_feature_engineering_workflow(
         self,
-        sample_dataframe: pl.DataFrame,
-        temp_dir: Path
+        ts_data: its.TimeSeriesData,
+        feature_engineering_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test feature engineering with lag and standardization."""
-        config = """
-[pipeline]
-name = "feature_engineering"
-
-[[operations]]
-type = "lag"
-periods = [1, 2, 3]
-columns = ["temperature", "pressure"]
-
-[[operations]]
-type = "standardize"
-"""
-        config_path = temp_dir / "feat_eng.toml"
-        config_path.write_text(config)
-
         # Process
-        ts_data = its.TimeSeriesData(sample_dataframe)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(feature_engineering_config)
         result = pipeline.process(ts_data)
 
-        result_df = result.to_polars()
-
         # Verify lag features were created
-        lag_cols = [col for col in result_df.columns if "lag" in col.lower()]
+        lag_cols = [col for col in result.columns if "lag" in col.lower()]
         assert len(lag_cols) > 0
         # Should have lag features for both columns and all periods
         # (2 columns * 3 periods = 6 lag columns)
@@ -141,134 +87,93 @@ type = "standardize"
 
     def test_multi_step_transformation(
         self,
-        sample_dataframe_with_nulls: pl.DataFrame,
-        temp_dir: Path
+        ts_data_nulls: its.TimeSeriesData,
+        multi_op_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test multi-step transformation pipeline."""
-        config = """
-[pipeline]
-name = "multi_step"
-
-# Step 1: Clean nulls
-[[operations]]
-type = "fill_null"
-method = "forward"
-
-# Step 2: Create features
-[[operations]]
-type = "lag"
-periods = [1, 2]
-columns = ["temperature"]
-
-# Step 3: Normalize
-[[operations]]
-type = "standardize"
-"""
-        config_path = temp_dir / "multi_step.toml"
-        config_path.write_text(config)
-
         # Process
-        ts_data = its.TimeSeriesData(sample_dataframe_with_nulls)
-        pipeline = its.Pipeline.from_toml(str(config_path))
-        result = pipeline.process(ts_data)
-
-        result_df = result.to_polars()
+        pipeline = pipeline_factory(multi_op_pipeline_config)
+        result = pipeline.process(ts_data_nulls)
 
         # Verify all steps executed
-        assert result_df is not None
-        assert len(result_df) > 0
-        assert "temperature_lag_1" in result_df.columns
-        assert "temperature_lag_2" in result_df.columns
+        assert len(result) > 0
+        assert {"temperature_lag_1", "temperature_lag_2"} <= set(result.columns)
 
 
 class TestRealWorldScenarios:
     """Tests simulating real-world use cases."""
 
-    def test_sensor_data_processing(self, temp_dir: Path) -> None:
+    def test_sensor_data_processing(self) -> None:
         """Test processing industrial sensor data."""
         from datetime import datetime
 
-        # Create realistic sensor data
+        # Two days of hourly sensor data: enough history for the 24h lag
         dates = pl.datetime_range(
             start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 31),
+            end=datetime(2024, 1, 3),
             interval="1h",
             eager=True,
         )
 
+        idx = pl.int_range(0, dates.len(), eager=True).cast(pl.Float64)
         df = pl.DataFrame({
             "DateTime": dates,
-            "sensor_temp": [20.0 + i * 0.1 for i in range(len(dates))],
-            "sensor_pressure": [1013 + i * 0.5 for i in range(len(dates))],
-            "sensor_flow": [50.0 + i * 0.2 for i in range(len(dates))],
+            "sensor_temp": 20.0 + idx * 0.1,
+            "sensor_pressure": 1013 + idx * 0.5,
+            "sensor_flow": 50.0 + idx * 0.2,
         })
 
         # Add some null values to simulate sensor failures
         df = df.with_columns([
-            pl.when(pl.col("sensor_temp") > 30)
+            pl.when(pl.col("sensor_temp") > 24)
             .then(None)
             .otherwise(pl.col("sensor_temp"))
             .alias("sensor_temp")
         ])
 
         # Process
-        config = """
-[pipeline]
-name = "sensor_processing"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-
-[[operations]]
-type = "lag"
-periods = [1, 24]  # 1 hour and 1 day lag
-columns = ["sensor_temp", "sensor_pressure"]
-
-[[operations]]
-type = "standardize"
-"""
-        config_path = temp_dir / "sensor.toml"
-        config_path.write_text(config)
-
+        config = {
+            "pipeline": {"name": "sensor_processing"},
+            "operations": [
+                {"type": "fill_null", "method": "forward"},
+                # 1 hour and 1 day lag
+                {"type": "lag", "periods": [1, 24], "columns": ["sensor_temp", "sensor_pressure"]},
+                {"type": "standardize"},
+            ],
+        }
         ts_data = its.TimeSeriesData(df)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = its.Pipeline.from_dict(config)
         result = pipeline.process(ts_data)
 
-        result_df = result.to_polars()
-
         # Verify processing
-        assert len(result_df) > 0
-        assert "sensor_temp_lag_1" in result_df.columns
-        assert "sensor_temp_lag_24" in result_df.columns
+        assert len(result) > 0
+        assert {"sensor_temp_lag_1", "sensor_temp_lag_24"} <= set(result.columns)
 
     def test_batch_processing_multiple_files(
         self,
         sample_dataframe: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        basic_pipeline_config: dict[str, Any],
+        temp_dir: Path,
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test batch processing multiple data files."""
         # Create multiple input files
         input_files = []
         for i in range(3):
-            file_path = temp_dir / f"input_{i}.csv"
-            sample_dataframe.write_csv(str(file_path))
+            file_path = temp_dir / f"batch_input_{i}.parquet"
+            sample_dataframe.write_parquet(str(file_path))
             input_files.append(file_path)
 
-        # Save pipeline config
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-
         # Load pipeline once
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(basic_pipeline_config)
+
+        def run(input_file: Path) -> its.TimeSeriesData:
+            return pipeline.process(its.TimeSeriesData.from_parquet(str(input_file)))
 
-        # Process all files
-        results = []
-        for input_file in input_files:
-            ts_data = its.TimeSeriesData.from_csv(str(input_file))
-            result = pipeline.process(ts_data)
-            results.append(result)
+        # Process all files concurrently with the shared pipeline
+        with ThreadPoolExecutor(max_workers=len(input_files)) as executor:
+            results = list(executor.map(run, input_files))
 
         # Verify all processed
         assert len(results) == 3
@@ -278,14 +183,12 @@ type = "standardize"
     def test_pipeline_reusability(
         self,
         sample_dataframe: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        basic_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test that same pipeline can be applied to different datasets."""
         # Create pipeline
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(basic_pipeline_config)
 
         # Create different datasets
         df1 = sample_dataframe
@@ -309,15 +212,12 @@ type = "standardize"
 class TestErrorHandling:
     """Test error handling in real-world scenarios."""
 
-    def test_corrupted_config_file(self, temp_dir: Path) -> None:
-        """Test handling of corrupted configuration file."""
-        config_path = temp_dir / "corrupted.toml"
-        config_path.write_text("[[operations]\ntype = 'invalid")
+    def test_corrupted_config_file(self) -> None:
+        """Test handling of corrupted configuration text."""
+        with pytest.raises(ValueError):
+            its.Pipeline.from_toml_str("[[operations]\ntype = 'invalid")
 
-        with pytest.raises(Exception):
-            its.Pipeline.from_toml(str(config_path))
-
-    def test_missing_required_columns(self, temp_dir: Path) -> None:
+    def test_missing_required_columns(self) -> None:
         """Test handling when specified columns don't exist."""
         from datetime import datetime
 
@@ -331,20 +231,14 @@ class TestErrorHandling:
             "temp": [20.0] * 10,
         })
 
-        config = """
-[pipeline]
-name = "test"
-
-[[operations]]
-type = "lag"
-periods = [1]
-columns = ["nonexistent_column"]
-"""
-        config_path = temp_dir / "bad_cols.toml"
-        config_path.write_text(config)
-
+        config = {
+            "pipeline": {"name": "test"},
+            "operations": [
+                {"type": "lag", "periods": [1], "columns": ["nonexistent_column"]},
+            ],
+        }
         ts_data = its.TimeSeriesData(df)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = its.Pipeline.from_dict(config)
 
         # This should raise an error or handle gracefully
         with pytest.raises(Exception):
@@ -352,28 +246,15 @@ columns = ["nonexistent_column"]
 
     def test_empty_dataframe_processing(
         self,
-        temp_dir: Path
+        fill_null_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test processing empty DataFrame."""
-        df = pl.DataFrame({
-            "DateTime": pl.Series([], dtype=pl.Datetime),
-            "value": pl.Series([], dtype=pl.Float64),
-        })
+        df = pl.DataFrame(schema={"DateTime": pl.Datetime, "value": pl.Float64})
 
         # Use a simpler config without standardization (which needs > 1 row)
-        config = """
-[pipeline]
-name = "simple"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-"""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(config)
-
         ts_data = its.TimeSeriesData(df)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(fill_null_pipeline_config)
 
         # Should handle empty data gracefully
         result = pipeline.process(ts_data)
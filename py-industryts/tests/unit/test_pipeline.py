@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import industryts as its
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
+
+if TYPE_CHECKING:
+    from tests.conftest import PipelineFactory
 
 
 class TestPipelineCreation:
     """Tests for Pipeline creation and initialization."""
 
+    @pytest.mark.unit
     def test_create_empty_pipeline(self) -> None:
         """Test creating an empty pipeline."""
         pipeline = its.Pipeline()
@@ -19,10 +26,10 @@ class TestPipelineCreation:
         assert pipeline is not None
         assert len(pipeline) == 0
 
-    def test_from_toml(self, basic_pipeline_config: str, temp_dir: Path) -> None:
+    def test_from_toml(self, basic_pipeline_toml: str, temp_dir: Path) -> None:
         """Test loading pipeline from TOML config."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
+        config_path = temp_dir / "from_toml.toml"
+        config_path.write_text(basic_pipeline_toml)
 
         pipeline = its.Pipeline.from_toml(str(config_path))
 
@@ -31,18 +38,42 @@ class TestPipelineCreation:
 
     def test_from_toml_with_path_object(
         self,
-        basic_pipeline_config: str,
+        basic_pipeline_toml: str,
         temp_dir: Path
     ) -> None:
         """Test loading pipeline from Path object."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
+        config_path = temp_dir / "from_toml_path.toml"
+        config_path.write_text(basic_pipeline_toml)
 
         pipeline = its.Pipeline.from_toml(config_path)
 
         assert pipeline is not None
         assert len(pipeline) > 0
 
+    @pytest.mark.unit
+    def test_from_toml_str(self, basic_pipeline_toml: str) -> None:
+        """Test loading pipeline from a TOML string."""
+        pipeline = its.Pipeline.from_toml_str(basic_pipeline_toml)
+
+        assert isinstance(pipeline, its.Pipeline)
+        assert len(pipeline) == 2
+
+    @pytest.mark.unit
+    def test_from_dict(self, basic_pipeline_config: dict[str, Any]) -> None:
+        """Test building pipeline from a config dict."""
+        pipeline = its.Pipeline.from_dict(basic_pipeline_config)
+
+        assert isinstance(pipeline, its.Pipeline)
+        assert len(pipeline) == 2
+
+    @pytest.mark.unit
+    def test_from_dict_invalid_config(self) -> None:
+        """Test building from a dict with an unknown operation raises ValueError."""
+        config = {"pipeline": {"name": "bad"}, "operations": [{"type": "unknown"}]}
+
+        with pytest.raises(ValueError):
+            its.Pipeline.from_dict(config)
+
     def test_from_toml_nonexistent_file(self, temp_dir: Path) -> None:
         """Test loading from non-existent file raises error."""
         nonexistent_path = temp_dir / "nonexistent.toml"
@@ -50,15 +81,14 @@ class TestPipelineCreation:
         with pytest.raises((OSError, FileNotFoundError, RuntimeError)):
             its.Pipeline.from_toml(str(nonexistent_path))
 
-    def test_from_toml_invalid_config(self, temp_dir: Path) -> None:
-        """Test loading invalid TOML raises error."""
-        config_path = temp_dir / "invalid.toml"
-        config_path.write_text("invalid toml content [[[")
-
-        with pytest.raises(Exception):  # Could be TOMLError or RuntimeError
-            its.Pipeline.from_toml(str(config_path))
+    @pytest.mark.unit
+    def test_from_toml_invalid_config(self) -> None:
+        """Test parsing invalid TOML raises error."""
+        with pytest.raises(ValueError):
+            its.Pipeline.from_toml_str("invalid toml content [[[")
 
 
+@pytest.mark.unit
 class TestPipelineProperties:
     """Tests for Pipeline properties."""
 
@@ -69,46 +99,39 @@ class TestPipelineProperties:
 
     def test_len_with_operations(
         self,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        any_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test length with operations."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
+        pipeline = pipeline_factory(any_pipeline_config)
 
-        pipeline = its.Pipeline.from_toml(str(config_path))
-
-        # basic_pipeline_config has 2 operations
-        assert len(pipeline) == 2
+        # One operation per entry in the operations list
+        assert len(pipeline) == len(any_pipeline_config["operations"])
 
-    def test_repr(self, basic_pipeline_config: str, temp_dir: Path) -> None:
+    def test_repr(
+        self,
+        any_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
+    ) -> None:
         """Test __repr__ method."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(any_pipeline_config)
         repr_str = repr(pipeline)
 
         assert "Pipeline" in repr_str
 
 
+@pytest.mark.unit
 class TestPipelineProcessing:
     """Tests for pipeline processing."""
 
     def test_process_basic_pipeline(
         self,
-        sample_dataframe: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        ts_data: its.TimeSeriesData,
+        basic_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test processing data through basic pipeline."""
-        # Create pipeline
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
-
-        # Create time series data
-        ts_data = its.TimeSeriesData(sample_dataframe)
+        pipeline = pipeline_factory(basic_pipeline_config)
 
         # Process
         result = pipeline.process(ts_data)
@@ -119,53 +142,42 @@ class TestPipelineProcessing:
 
     def test_process_preserves_time_column(
         self,
-        sample_dataframe: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        ts_data: its.TimeSeriesData,
+        basic_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test that processing preserves time column."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(basic_pipeline_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe)
         result = pipeline.process(ts_data)
 
         assert result.time_column == ts_data.time_column
 
     def test_process_feature_engineering(
         self,
-        sample_dataframe: pl.DataFrame,
-        feature_engineering_config: str,
-        temp_dir: Path
+        ts_data: its.TimeSeriesData,
+        feature_engineering_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test feature engineering pipeline."""
-        config_path = temp_dir / "feature_eng.toml"
-        config_path.write_text(feature_engineering_config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(feature_engineering_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe)
         result = pipeline.process(ts_data)
 
-        result_df = result.to_polars()
-
         # Should have lag features
-        lag_columns = [col for col in result_df.columns if "lag" in col.lower()]
+        lag_columns = [col for col in result.columns if "lag" in col.lower()]
         assert len(lag_columns) > 0
 
     def test_process_with_nulls(
         self,
-        sample_dataframe_with_nulls: pl.DataFrame,
-        basic_pipeline_config: str,
-        temp_dir: Path
+        ts_data_nulls: its.TimeSeriesData,
+        basic_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test processing data with null values."""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(basic_pipeline_config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(basic_pipeline_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe_with_nulls)
-        result = pipeline.process(ts_data)
+        result = pipeline.process(ts_data_nulls)
 
         assert result is not None
         assert len(result) > 0
@@ -176,17 +188,17 @@ class TestPipelineConfigIO:
 
     def test_to_toml(
         self,
-        basic_pipeline_config: str,
+        basic_pipeline_toml: str,
         temp_dir: Path
     ) -> None:
         """Test saving pipeline to TOML."""
         # Load pipeline
-        load_path = temp_dir / "load.toml"
-        load_path.write_text(basic_pipeline_config)
+        load_path = temp_dir / "to_toml_load.toml"
+        load_path.write_text(basic_pipeline_toml)
         pipeline = its.Pipeline.from_toml(str(load_path))
 
         # Save to new file
-        save_path = temp_dir / "save.toml"
+        save_path = temp_dir / "to_toml_save.toml"
         pipeline.to_toml(str(save_path))
 
         assert save_path.exists()
@@ -194,17 +206,17 @@ class TestPipelineConfigIO:
 
     def test_toml_roundtrip(
         self,
-        basic_pipeline_config: str,
+        basic_pipeline_toml: str,
         temp_dir: Path
     ) -> None:
         """Test TOML save/load roundtrip."""
         # Load original
-        original_path = temp_dir / "original.toml"
-        original_path.write_text(basic_pipeline_config)
+        original_path = temp_dir / "roundtrip_original.toml"
+        original_path.write_text(basic_pipeline_toml)
         original_pipeline = its.Pipeline.from_toml(str(original_path))
 
         # Save
-        save_path = temp_dir / "saved.toml"
+        save_path = temp_dir / "roundtrip_saved.toml"
         original_pipeline.to_toml(str(save_path))
 
         # Load saved
@@ -214,29 +226,20 @@ class TestPipelineConfigIO:
         assert len(loaded_pipeline) == len(original_pipeline)
 
 
+@pytest.mark.unit
 class TestPipelineOperations:
     """Tests for specific operations in pipeline."""
 
     def test_fill_null_operation(
         self,
-        sample_dataframe_with_nulls: pl.DataFrame,
-        temp_dir: Path
+        ts_data_nulls: its.TimeSeriesData,
+        fill_null_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test fill_null operation."""
-        config = """
-[pipeline]
-name = "fill_test"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-"""
-        config_path = temp_dir / "fill_null.toml"
-        config_path.write_text(config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(fill_null_pipeline_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe_with_nulls)
-        result = pipeline.process(ts_data)
+        result = pipeline.process(ts_data_nulls)
 
         result_df = result.to_polars()
 
@@ -245,133 +248,94 @@ method = "forward"
 
     def test_standardize_operation(
         self,
+        ts_data: its.TimeSeriesData,
         sample_dataframe: pl.DataFrame,
-        temp_dir: Path
+        standardize_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test standardize operation."""
-        config = """
-[pipeline]
-name = "standardize_test"
-
-[[operations]]
-type = "standardize"
-columns = ["temperature", "pressure"]
-"""
-        config_path = temp_dir / "standardize.toml"
-        config_path.write_text(config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(standardize_pipeline_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe)
         result = pipeline.process(ts_data)
 
         result_df = result.to_polars()
 
-        # Standardized values should have different scale
-        assert result_df is not None
-        assert len(result_df) == len(sample_dataframe)
+        # Same columns and rows; only the feature values are rescaled
+        assert set(result_df.schema) == set(sample_dataframe.schema)
+        assert_frame_equal(result_df.select("DateTime"), sample_dataframe.select("DateTime"))
 
     def test_lag_operation(
         self,
-        sample_dataframe: pl.DataFrame,
-        temp_dir: Path
+        ts_data: its.TimeSeriesData,
+        sample_dataframe: pl.DataFrame
     ) -> None:
         """Test lag operation."""
-        config = """
-[pipeline]
-name = "lag_test"
-
-[[operations]]
-type = "lag"
-periods = [1, 2]
-columns = ["temperature"]
-"""
-        config_path = temp_dir / "lag.toml"
-        config_path.write_text(config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        config = {
+            "pipeline": {"name": "lag_test"},
+            "operations": [
+                {"type": "lag", "periods": [1, 2], "columns": ["temperature"]},
+            ],
+        }
+        pipeline = its.Pipeline.from_dict(config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe)
         result = pipeline.process(ts_data)
-
         result_df = result.to_polars()
 
-        # Should have lag columns
-        assert "temperature_lag_1" in result_df.columns
-        assert "temperature_lag_2" in result_df.columns
+        # Should add the lag columns and leave the originals untouched
+        expected = set(sample_dataframe.schema) | {"temperature_lag_1", "temperature_lag_2"}
+        assert set(result_df.schema) == expected
+        assert_frame_equal(
+            result_df.select(sample_dataframe.columns),
+            sample_dataframe,
+            check_dtypes=False,
+            check_exact=False,
+        )
 
     def test_multiple_operations(
         self,
-        sample_dataframe_with_nulls: pl.DataFrame,
-        temp_dir: Path
+        ts_data_nulls: its.TimeSeriesData,
+        multi_op_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test pipeline with multiple operations."""
-        config = """
-[pipeline]
-name = "multi_op_test"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-
-[[operations]]
-type = "lag"
-periods = [1]
-columns = ["temperature"]
-
-[[operations]]
-type = "standardize"
-"""
-        config_path = temp_dir / "multi_op.toml"
-        config_path.write_text(config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(multi_op_pipeline_config)
 
-        ts_data = its.TimeSeriesData(sample_dataframe_with_nulls)
-        result = pipeline.process(ts_data)
-
-        result_df = result.to_polars()
+        result = pipeline.process(ts_data_nulls)
 
-        # Should have processed successfully
-        assert result_df is not None
         # Should have lag column
-        assert any("lag" in col.lower() for col in result_df.columns)
+        assert any("lag" in col.lower() for col in result.columns)
 
 
+@pytest.mark.unit
 class TestPipelineEdgeCases:
     """Tests for edge cases."""
 
-    def test_empty_pipeline_processing(self, sample_dataframe: pl.DataFrame) -> None:
+    def test_empty_pipeline_processing(
+        self,
+        ts_data: its.TimeSeriesData,
+        sample_dataframe: pl.DataFrame
+    ) -> None:
         """Test processing with empty pipeline."""
         pipeline = its.Pipeline()
-        ts_data = its.TimeSeriesData(sample_dataframe)
 
         # Empty pipeline should return data unchanged
         result = pipeline.process(ts_data)
 
-        assert result is not None
-        assert len(result) == len(ts_data)
+        assert_frame_equal(result.to_polars(), sample_dataframe)
 
     def test_pipeline_with_single_row(
         self,
-        sample_datetime_range: pl.Series,
-        temp_dir: Path
+        fill_null_pipeline_config: dict[str, Any],
+        pipeline_factory: PipelineFactory
     ) -> None:
         """Test processing single-row data."""
         df = pl.DataFrame({
-            "DateTime": sample_datetime_range[:1],
+            "DateTime": [datetime(2024, 1, 1)],
             "value": [42.0],
         })
 
         # Use a simpler config without standardization (which needs > 1 row)
-        config = """
-[pipeline]
-name = "simple"
-
-[[operations]]
-type = "fill_null"
-method = "forward"
-"""
-        config_path = temp_dir / "pipeline.toml"
-        config_path.write_text(config)
-        pipeline = its.Pipeline.from_toml(str(config_path))
+        pipeline = pipeline_factory(fill_null_pipeline_config)
 
         ts_data = its.TimeSeriesData(df)
         result = pipeline.process(ts_data)
@@ -0,0 +1,125 @@
+"""I/O tests for TimeSeriesData class (Parquet, IPC and CSV readers and writers)."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Literal
+
+import pyarrow.parquet as pq
+import pytest
+from industryts import TimeSeriesData
+from industryts.timeseries import ParquetCompression
+
+pytestmark = pytest.mark.io
+
+
+class TestTimeSeriesDataIO:
+    """Tests for I/O operations."""
+
+    @pytest.mark.slow
+    def test_from_csv(
+        self,
+        ts_data: TimeSeriesData,
+        saved_ts_paths: Path,
+        sample_len: int
+    ) -> None:
+        """Smoke test for CSV loading; Parquet is the canonical roundtrip."""
+        loaded_ts = TimeSeriesData.from_csv(str(saved_ts_paths / "x.csv"))
+
+        assert len(loaded_ts) == sample_len
+        assert loaded_ts.time_column == ts_data.time_column
+        assert loaded_ts.feature_columns == ts_data.feature_columns
+
+    @pytest.mark.parametrize(
+        ("engine", "compression"),
+        [("polars", "snappy"), ("pyarrow", "zstd")],
+    )
+    def test_to_parquet(
+        self,
+        ts_data: TimeSeriesData,
+        engine: Literal["polars", "pyarrow"],
+        compression: ParquetCompression
+    ) -> None:
+        """Test saving to Parquet, in memory, with each writer backend."""
+        buf = io.BytesIO()
+
+        ts_data.to_parquet(buf, engine=engine, compression=compression)
+
+        assert buf.getbuffer().nbytes > 0
+        buf.seek(0)
+        metadata = pq.ParquetFile(buf).metadata
+        assert metadata.num_rows == len(ts_data)
+        assert metadata.row_group(0).column(0).compression == compression.upper()
+
+    @pytest.mark.parametrize(
+        ("use_pyarrow", "writer"),
+        [(True, "parquet-cpp-arrow"), (False, "Polars")],
+    )
+    def test_to_parquet_use_pyarrow(
+        self,
+        ts_data: TimeSeriesData,
+        use_pyarrow: bool,
+        writer: str
+    ) -> None:
+        """Test that the write_parquet ``use_pyarrow`` flag still selects the writer."""
+        buf = io.BytesIO()
+
+        ts_data.to_parquet(buf, use_pyarrow=use_pyarrow)
+
+        buf.seek(0)
+        assert pq.ParquetFile(buf).metadata.created_by.startswith(writer)
+
+    def test_to_parquet_engine_conflicts_with_use_pyarrow(
+        self,
+        ts_data: TimeSeriesData
+    ) -> None:
+        """Test that an engine disagreeing with ``use_pyarrow`` raises ValueError."""
+        with pytest.raises(ValueError, match="use_pyarrow"):
+            ts_data.to_parquet(io.BytesIO(), engine="polars", use_pyarrow=True)
+
+    def test_to_parquet_invalid_engine(self, ts_data: TimeSeriesData) -> None:
+        """Test that an unknown writer backend raises ValueError."""
+        with pytest.raises(ValueError, match="engine"):
+            ts_data.to_parquet(io.BytesIO(), engine="fastparquet")  # type: ignore[arg-type]
+
+    def test_from_parquet(
+        self,
+        ts_data: TimeSeriesData,
+        saved_ts_paths: Path,
+        sample_len: int
+    ) -> None:
+        """Test loading from Parquet file."""
+        loaded_ts = TimeSeriesData.from_parquet(str(saved_ts_paths / "x.parquet"))
+
+        assert len(loaded_ts) == sample_len
+        assert loaded_ts.time_column == ts_data.time_column
+        assert loaded_ts.feature_columns == ts_data.feature_columns
+
+    def test_from_ipc(
+        self,
+        ts_data: TimeSeriesData,
+        saved_ts_paths: Path,
+        sample_len: int
+    ) -> None:
+        """Test loading from Arrow IPC file."""
+        loaded_ts = TimeSeriesData.from_ipc(str(saved_ts_paths / "x.arrow"))
+
+        assert len(loaded_ts) == sample_len
+        assert loaded_ts.time_column == ts_data.time_column
+        assert loaded_ts.feature_columns == ts_data.feature_columns
+
+    def test_parquet_roundtrip_preserves_data(self, ts_data: TimeSeriesData) -> None:
+        """Test that Parquet save/load preserves data and dtypes."""
+        buf = io.BytesIO()
+
+        # Save and load
+        ts_data.to_parquet(buf)
+        buf.seek(0)
+        loaded_ts = TimeSeriesData.from_parquet(buf)
+
+        # Parquet keeps the schema, so the frames must match exactly
+        original_df = ts_data.to_polars()
+        loaded_df = loaded_ts.to_polars()
+
+        assert loaded_df.equals(original_df)
@@ -0,0 +1,178 @@
+"""Unit tests for TimeSeriesData class (in memory, no filesystem access)."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+from industryts import TimeSeriesData
+from pytest_subtests import SubTests
+
+pytestmark = pytest.mark.unit
+
+
+class TestTimeSeriesDataCreation:
+    """Tests for TimeSeriesData creation and initialization."""
+
+    @pytest.mark.parametrize(
+        ("time_col", "explicit"),
+        [
+            ("DateTime", None),
+            ("ts", "ts"),
+            ("tagTime", None),
+            ("timestamp", None),
+        ],
+        ids=["auto_datetime", "explicit_ts", "auto_tagtime", "auto_timestamp"],
+    )
+    def test_create_time_column(
+        self,
+        time_col: str,
+        explicit: str | None,
+        sample_dataframe_fresh: pl.DataFrame,
+        sample_len: int
+    ) -> None:
+        """Test the time column is taken from the argument or auto-detected by name."""
+        # Time column last, so the first-column fallback cannot pick it
+        df = sample_dataframe_fresh.rename({"DateTime": time_col}).select(
+            "temperature", "pressure", time_col
+        )
+
+        ts_data = TimeSeriesData(df, time_column=explicit)
+
+        assert len(ts_data) == sample_len
+        assert ts_data.time_column == time_col
+        assert ts_data.feature_columns == ["temperature", "pressure"]
+
+    def test_invalid_dataframe_type(self) -> None:
+        """Test that non-DataFrame input raises TypeError."""
+        with pytest.raises(TypeError, match="DataFrame"):
+            TimeSeriesData([1, 2, 3])  # type: ignore
+
+    def test_empty_dataframe(self) -> None:
+        """Test behavior with empty DataFrame."""
+        df = pl.DataFrame({
+            "DateTime": pl.Series([], dtype=pl.Datetime),
+            "value": pl.Series([], dtype=pl.Float64),
+        })
+
+        ts_data = TimeSeriesData(df)
+
+        assert len(ts_data) == 0
+        assert ts_data.time_column == "DateTime"
+
+
+class TestTimeSeriesDataProperties:
+    """Tests for TimeSeriesData properties and methods."""
+
+    def test_time_column_property(self, ts_data: TimeSeriesData) -> None:
+        """Test time_column property."""
+        assert isinstance(ts_data.time_column, str)
+        assert ts_data.time_column == "DateTime"
+
+    def test_feature_columns_property(self, ts_data: TimeSeriesData) -> None:
+        """Test feature_columns property."""
+        assert isinstance(ts_data.feature_columns, list)
+        assert set(ts_data.feature_columns) == {"temperature", "pressure"}
+
+    def test_columns_property(
+        self,
+        ts_data: TimeSeriesData,
+        sample_dataframe: pl.DataFrame
+    ) -> None:
+        """Test columns property."""
+        assert ts_data.columns == sample_dataframe.columns
+
+    def test_len(self, ts_data: TimeSeriesData) -> None:
+        """Test __len__ method."""
+        assert len(ts_data) == 10
+
+    def test_repr(self, ts_data: TimeSeriesData) -> None:
+        """Test __repr__ method."""
+        repr_str = repr(ts_data)
+
+        assert "TimeSeriesData" in repr_str
+        assert "10" in repr_str or "rows" in repr_str.lower()
+
+
+class TestTimeSeriesDataConversion:
+    """Tests for data conversion methods."""
+
+    def test_to_polars(self, ts_data: TimeSeriesData, sample_dataframe: pl.DataFrame) -> None:
+        """Test converting back to Polars DataFrame."""
+        result_df = ts_data.to_polars()
+
+        assert isinstance(result_df, pl.DataFrame)
+        assert result_df.shape == sample_dataframe.shape
+        assert result_df.columns == sample_dataframe.columns
+
+    def test_to_polars_preserves_data(
+        self,
+        ts_data: TimeSeriesData,
+        sample_dataframe: pl.DataFrame
+    ) -> None:
+        """Test that to_polars preserves data integrity."""
+        result_df = ts_data.to_polars()
+
+        # Compare data values
+        assert result_df.equals(sample_dataframe)
+
+
+class TestTimeSeriesDataHelpers:
+    """Tests for helper methods."""
+
+    def test_helpers(self, ts_data: TimeSeriesData, subtests: SubTests) -> None:
+        """Test head, tail and describe against one shared instance."""
+        with subtests.test(msg="head"):
+            head_df = ts_data.head(5)
+            assert isinstance(head_df, pl.DataFrame)
+            assert len(head_df) == 5
+
+        with subtests.test(msg="head default"):
+            assert len(ts_data.head()) == 5
+
+        with subtests.test(msg="tail"):
+            tail_df = ts_data.tail(3)
+            assert isinstance(tail_df, pl.DataFrame)
+            assert len(tail_df) == 3
+
+        with subtests.test(msg="tail default"):
+            assert len(ts_data.tail()) == 5
+
+        with subtests.test(msg="describe"):
+            desc_df = ts_data.describe()
+            assert isinstance(desc_df, pl.DataFrame)
+            # Should contain statistics for numeric columns
+            assert len(desc_df) > 0
+
+
+class TestTimeSeriesDataEdgeCases:
+    """Tests for edge cases and error handling."""
+
+    def test_single_row_dataframe(self, sample_datetime_range: pl.Series) -> None:
+        """Test with single row DataFrame."""
+        df = pl.DataFrame({
+            "DateTime": sample_datetime_range[:1],
+            "value": [42.0],
+        })
+
+        ts_data = TimeSeriesData(df)
+
+        assert len(ts_data) == 1
+        assert ts_data.time_column == "DateTime"
+
+    def test_dataframe_with_nulls(self, sample_dataframe_with_nulls: pl.DataFrame) -> None:
+        """Test creation with DataFrame containing null values."""
+        ts_data = TimeSeriesData(sample_dataframe_with_nulls)
+
+        assert ts_data is not None
+        assert len(ts_data) == 10
+
+    def test_many_feature_columns(self, sample_datetime_range: pl.Series) -> None:
+        """Test with many feature columns."""
+        # Column i holds the constant i, built in a single projection
+        df = pl.DataFrame({"DateTime": sample_datetime_range}).with_columns(
+            pl.lit(float(i)).alias(f"sensor_{i}") for i in range(50)
+        )
+        ts_data = TimeSeriesData(df)
+
+        assert ts_data.feature_columns == df.columns[1:]
+        assert ts_data.time_column == "DateTime"